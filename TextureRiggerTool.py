@@ -1,27 +1,119 @@
 import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
 import importlib
+import logging
+import os
+import re
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
 
 # Import logic files
 import step1_logic
-import step2_logic
-import step3_logic
-import step3_uv_logic  # Add import for the new module
+
+# Step 2/3 logic is only needed once the user gets that far, so import it on first use
+def _step2():
+    import step2_logic
+    return step2_logic
+
+def _step3():
+    import step3_logic
+    return step3_logic
+
+def _step3_uv():
+    import step3_uv_logic
+    return step3_uv_logic
+
+def _dev_reload():
+    """
+    Reloads the logic modules so code edits are picked up without restarting Maya.
+    Runs automatically on import only when TEXTURE_RIGGER_DEV is set.
+    """
+    importlib.reload(step1_logic)
+    importlib.reload(_step2())
+    importlib.reload(_step3())
+    importlib.reload(_step3_uv())
 
 # For reloading modules during development (optional)
-importlib.reload(step1_logic)
-importlib.reload(step2_logic)
-importlib.reload(step3_logic)
-importlib.reload(step3_uv_logic)  # Add reload for the new module
+if os.environ.get("TEXTURE_RIGGER_DEV"):
+    _dev_reload()
+
+# Debug chatter from UI callbacks; formatted only when the DEBUG level is enabled
+log = logging.getLogger("TextureRigger")
+
+# Characters not allowed in a node name prefix
+_PREFIX_RE = re.compile(r'[^A-Za-z0-9_]+')
+
+# Trailing numeric suffix used to suggest the next locator prefix
+_SUFFIX_RE = re.compile(r'^(.*?)_(\d+)$')
+
+def _suffix_next_prefix(prefix):
+    match = _SUFFIX_RE.match(prefix)
+    if match:
+        return f"{match.group(1)}_{int(match.group(2)) + 1}"
+    return f"{prefix}_1"
+
+@contextmanager
+def _suspend_refresh(chunk_name, light=False):
+    """
+    Runs a batch of scene edits without viewport redraws or parallel evaluation,
+    as a single undo step. Everything is restored on exit, even on error.
+    light=True keeps only the undo chunk and refresh suspension, for small edits
+    where hiding the main pane and rebuilding the evaluation graph cost more than they save.
+    """
+    # Neither the main pane nor the Evaluation Manager is guaranteed (batch mode, older Maya)
+    main_pane = None
+    eval_mode = "off"
+    if not light:
+        try:
+            main_pane = mel.eval('$tmp = $gMainPane')
+        except RuntimeError:
+            main_pane = None
+        if main_pane and not cmds.paneLayout(main_pane, exists=True):
+            main_pane = None
+        try:
+            eval_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        except (AttributeError, RuntimeError):
+            eval_mode = "off"
+    # Track each step so a failure part-way through only undoes what actually ran
+    opened = suspended = hidden = em_changed = False
+    try:
+        cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+        opened = True
+        cmds.refresh(suspend=True)
+        suspended = True
+        if main_pane:
+            cmds.paneLayout(main_pane, edit=True, manage=False)
+            hidden = True
+        if eval_mode != "off":
+            cmds.evaluationManager(mode="off")
+            em_changed = True
+        yield
+    finally:
+        if em_changed:
+            cmds.evaluationManager(mode=eval_mode)
+        if hidden:
+            cmds.paneLayout(main_pane, edit=True, manage=True)
+        if suspended:
+            cmds.refresh(suspend=False)
+        if opened:
+            cmds.undoInfo(closeChunk=True)
 
 class TextureRiggerUI:
+    # Status label background per success state: neutral, success, failure
+    _STATUS_COLORS = MappingProxyType({None: (0.9, 0.9, 0.9), True: (0.6, 0.9, 0.6), False: (0.9, 0.6, 0.6)})
+
     def __init__(self):
         self.window_name = "textureRiggerMainWindow"
         self.ui_title = "Texture Rigger 0.0.3"
+        self.window = None
 
         self.selected_mesh_transform = None
         self.selected_mesh_shape = None
         
         self.locators_data = {}
+        self._active_prefixes = set()  # Prefixes in use by locators_data or follicles_data
         self.follicles_data = {}
         self.textures_data = {}
         
@@ -50,14 +142,42 @@ class TextureRiggerUI:
         self.sequence_checkboxes = {}  # {prefix: checkbox_widget}
         self.projection_checkboxes = {}  # {prefix: checkbox_widget} - Add this new line
 
+        self._ui_building = False  # Guards UI callbacks while widgets are being rebuilt
+        self._last_status = {}  # {status_label: (message, success)} last written to each label
+        self._enabled_state = {}  # {control: bool} last enable state set through _set_enabled
+        self._step3_dirty = False  # Step 3 texture rows need rebuilding for the current follicles
+
+    @contextmanager
+    def _batched_ui_edit(self, chunk_name):
+        """
+        Suspends viewport refresh and groups the enclosed commands into a single undo chunk.
+        Callbacks check self._ui_building so they don't fire while widgets are rebuilt.
+        """
+        self._ui_building = True
+        cmds.refresh(suspend=True)
+        cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh(suspend=False)
+            self._ui_building = False
+
     def on_window_close(self, *args):
         self.reset_tool_state()
         step1_logic.clear_reference_follicle()
 
     def create_ui(self):
         if cmds.window(self.window_name, exists=True):
+            if self.window == self.window_name:
+                # Our own window is still open: reset it and bring it to front instead of rebuilding
+                self.reset_tool_state()
+                cmds.showWindow(self.window)
+                return
             cmds.deleteUI(self.window_name, window=True)
 
+        self._last_status.clear()
+        self._enabled_state.clear()
         self.window = cmds.window(
             self.window_name, 
             title=self.ui_title, 
@@ -110,30 +230,57 @@ class TextureRiggerUI:
         cmds.showWindow(self.window)
 
     def on_name_changed(self, new_name):
+        if self._ui_building:
+            return
         if not new_name or new_name.isspace():
             self.name_prefix = "textureRig" 
             cmds.textField(self.name_field, edit=True, text=self.name_prefix)
             cmds.warning("Prefix cannot be empty. Using default 'textureRig'.")
+        elif new_name == self.name_prefix:
+            return  # Already clean and stored
+        elif _PREFIX_RE.search(new_name) is None:
+            self.name_prefix = new_name  # Already clean, nothing to strip or write back
         else:
-            cleaned_name = ''.join(c for c in new_name if c.isalnum() or c == '_')
+            cleaned_name = _PREFIX_RE.sub('', new_name)
             if cleaned_name != new_name:
                 cmds.textField(self.name_field, edit=True, text=cleaned_name)
             self.name_prefix = cleaned_name
 
     def _is_prefix_unique(self, prefix_to_check):
-        return prefix_to_check not in self.locators_data
+        return prefix_to_check not in self._active_prefixes
 
     def _update_locator_list_widget(self):
-        cmds.textScrollList(self.locator_list_widget, edit=True, removeAll=True)
-        for prefix, locator_name in self.locators_data.items():
-            cmds.textScrollList(self.locator_list_widget, edit=True, append=f"{prefix}: {locator_name}")
+        items = [f"{prefix}: {locator_name}" for prefix, locator_name in self.locators_data.items()]
+        # One edit call instead of one per locator; append accepts a list of strings
+        if items:
+            cmds.textScrollList(self.locator_list_widget, edit=True, removeAll=True, append=items)
+        else:
+            cmds.textScrollList(self.locator_list_widget, edit=True, removeAll=True)
+
+    def _set_enabled(self, edit_command, control, enable):
+        # Skip the edit, and the repaint it triggers, when the control is already in that state
+        if self._enabled_state.get(control) == enable:
+            return
+        edit_command(control, edit=True, enable=enable)
+        self._enabled_state[control] = enable
+
+    def _append_locator_list_row(self, prefix, locator_name):
+        # Adding one locator doesn't change existing rows, so append instead of rebuilding
+        cmds.textScrollList(self.locator_list_widget, edit=True, append=[f"{prefix}: {locator_name}"])
 
     def _update_status(self, status_label, message, success=None):
-        color = (0.9, 0.9, 0.9)
-        if success is True: color = (0.6, 0.9, 0.6)
-        elif success is False: color = (0.9, 0.6, 0.6)
-        cmds.text(status_label, edit=True, label=f"Status: {message}", backgroundColor=color)
-        
+        # Only send the parts that changed; skip the UI write entirely if nothing did
+        last_message, last_success = self._last_status.get(status_label, (None, object()))
+        edits = {}
+        if message != last_message:
+            edits['label'] = f"Status: {message}"
+        if success is not last_success:
+            edits['backgroundColor'] = self._STATUS_COLORS[success]
+        if not edits:
+            return
+        self._last_status[status_label] = (message, success)
+        cmds.text(status_label, edit=True, **edits)
+
     def update_step1_status(self, message, success=None):
         self._update_status(self.step1_status_label, message, success)
 
@@ -143,6 +290,27 @@ class TextureRiggerUI:
     def update_step3_status(self, message, success=None):
         self._update_status(self.step3_status_label, message, success)
 
+    def _live(self, *names):
+        """
+        Returns the subset of the given node names that exist, using one ls query.
+        """
+        names = [name for name in names if name]
+        # ls with an empty list would return every node in the scene
+        return set(cmds.ls(names)) if names else set()
+
+    def _resolve_slide_ctrl(self, control_name):
+        """
+        Returns the Slide ctrl for a Step 2 control: the control itself or its first
+        descendant named *_Slide_ctrl. None if there is none.
+        """
+        if "_Slide_ctrl" in control_name:
+            return control_name
+        children = cmds.listRelatives(control_name, allDescendents=True, type="transform") or []
+        for child in children:
+            if "_Slide_ctrl" in child:
+                return child
+        return None
+
     def on_create_follicles_click(self, *args):
         if not self.selected_mesh_shape:
             self.update_step2_status("Mesh not selected from Step 1.", success=False)
@@ -153,60 +321,91 @@ class TextureRiggerUI:
 
         step1_logic.clear_reference_follicle()
         
-        all_successful = True
+        failures = []
         created_count = 0
         self.follicles_data.clear()
 
-        for prefix, locator_name in self.locators_data.items():
-            if not cmds.objExists(self.selected_mesh_shape) or not cmds.objExists(locator_name):
-                self.update_step2_status(f"Mesh or locator '{locator_name}' (prefix: '{prefix}') no longer exists.", success=False)
-                all_successful = False
-                continue
+        live = self._live(self.selected_mesh_shape, *self.locators_data.values())
+        mesh_exists = self.selected_mesh_shape in live
+        step2 = _step2()
+        run_step2 = step2.run_step2_logic
+        # Every follicle hangs off the same mesh, so resolve its connection attributes once
+        mesh_sources = step2.get_mesh_connection_sources(self.selected_mesh_shape) if mesh_exists else None
+        locators_to_remove = []
+
+        with _suspend_refresh("createFollicles"):
+            for prefix, locator_name in self.locators_data.items():
+                if not mesh_exists or locator_name not in live:
+                    failures.append(f"Mesh or locator '{locator_name}' (prefix: '{prefix}') no longer exists.")
+                    continue
                 
-            follicle_transform, main_control = step2_logic.run_step2_logic(self.selected_mesh_shape, locator_name, prefix)
+                follicle_transform, main_control = run_step2(self.selected_mesh_shape, locator_name, prefix, mesh_sources)
             
-            if follicle_transform and main_control:
-                self.follicles_data[prefix] = {
-                    'follicle': follicle_transform, 
-                    'control': main_control,
-                    'locator_at_creation': locator_name
-                }
-                created_count += 1
+                if follicle_transform and main_control:
+                    self.follicles_data[prefix] = {
+                        'follicle': follicle_transform, 
+                        'control': main_control,
+                        'slide_ctrl': self._resolve_slide_ctrl(main_control),
+                        'locator_at_creation': locator_name
+                    }
+                    created_count += 1
+                    locators_to_remove.append(locator_name)
+                else:
+                    failures.append(f"Failed to create follicle for prefix '{prefix}'.")
+
+            # Re-check before the single delete call: one missing name would make it delete nothing
+            still_alive = self._live(*locators_to_remove)
+            locators_to_remove = [name for name in locators_to_remove if name in still_alive]
+            deleted_locators = set()
+            if locators_to_remove:
                 try:
-                    if cmds.objExists(locator_name):
-                        cmds.delete(locator_name)
+                    cmds.delete(locators_to_remove)
+                    deleted_locators.update(locators_to_remove)
                 except Exception as e:
-                    print(f"Could not delete locator '{locator_name}': {e}")
-            else:
-                all_successful = False
-                self.update_step2_status(f"Failed to create follicle for prefix '{prefix}'.", success=False)
-
-        processed_prefixes = list(self.follicles_data.keys())
-        for prefix in processed_prefixes:
-            if prefix in self.locators_data:
-                del self.locators_data[prefix]
-        self._update_locator_list_widget()
+                    print(f"Could not delete locators {locators_to_remove}: {e}")
+
+        # Report failures once instead of rewriting the status label per locator
+        all_successful = not failures
+        if failures:
+            cmds.warning(" ".join(failures))
+
+        remaining_locators = {p: n for p, n in self.locators_data.items() if n not in deleted_locators}
+        if len(remaining_locators) != len(self.locators_data):
+            self.locators_data = remaining_locators
+            self._update_locator_list_widget()
+        self._active_prefixes = self.locators_data.keys() | self.follicles_data.keys()
 
         if created_count > 0:
             self.update_step2_status(f"Successfully created {created_count} follicle(s)/control(s).", success=True)
-            cmds.button(self.create_follicles_button, edit=True, enable=False)
-            cmds.button(self.create_locator_button, edit=True, enable=False)
-            cmds.textField(self.name_field, edit=True, enable=False)
+            self._set_enabled(cmds.button, self.create_follicles_button, False)
+            self._set_enabled(cmds.button, self.create_locator_button, False)
+            self._set_enabled(cmds.textField, self.name_field, False)
             
-            self._populate_texture_selection_ui()
-            cmds.frameLayout(self.step3_frame, edit=True, enable=True)
+            # Build the texture rows once Maya is idle so the Step 2 click returns right away
+            self._step3_dirty = True
+            cmds.evalDeferred(self._ensure_texture_selection_ui)
+            self._set_enabled(cmds.frameLayout, self.step3_frame, True)
             self.update_step3_status(f"Select textures for {len(self.follicles_data)} prefix(es).")
             if self.follicles_data:
-                cmds.button(self.connect_all_textures_button, edit=True, enable=True)
+                self._set_enabled(cmds.button, self.connect_all_textures_button, True)
         elif not self.locators_data:
             self.update_step2_status("No locators available or all failed. Please restart Step 1.", success=False)
         else:
             self.update_step2_status(f"Processed locators. {created_count} created. Some may have failed or remain.", success=all_successful)
 
+    def _ensure_texture_selection_ui(self):
+        if self._step3_dirty:
+            self._step3_dirty = False
+            self._populate_texture_selection_ui()
+
     def _populate_texture_selection_ui(self):
+        with self._batched_ui_edit("populateTexUI"):
+            self._build_texture_selection_rows()
+
+    def _build_texture_selection_rows(self):
         children = cmds.columnLayout(self.texture_selection_layout, query=True, childArray=True) or []
-        for child in children:
-            cmds.deleteUI(child)
+        if children:
+            cmds.deleteUI(*children)
         
         self.texture_path_fields.clear()
         self.select_texture_buttons.clear()
@@ -217,25 +416,30 @@ class TextureRiggerUI:
             cmds.text(label="No follicles created. Cannot select textures.", parent=self.texture_selection_layout)
             return
 
-        for prefix in self.follicles_data.keys():
+        # Local bindings for the widget commands issued once per prefix
+        row_column_layout, text, text_field = cmds.rowColumnLayout, cmds.text, cmds.textField
+        button, check_box, set_parent, separator = cmds.button, cmds.checkBox, cmds.setParent, cmds.separator
+        parent_layout = self.texture_selection_layout
+
+        for prefix in self.follicles_data:
             # Create main row layout for texture selection
-            row_layout = cmds.rowColumnLayout(numberOfColumns=3, columnWidth=[(1, 120), (2, 200), (3, 100)], parent=self.texture_selection_layout, rowSpacing=(1,3))
-            cmds.text(label=f"Texture for '{prefix}':", align="right")
-            path_field = cmds.textField(text="No texture selected", editable=False, width=190) 
-            select_button = cmds.button(label="Select File...", command=lambda ignored_arg, p_captured=prefix: self._on_select_single_texture_click(p_captured))
-            cmds.setParent("..")
+            row_layout = row_column_layout(numberOfColumns=3, columnWidth=[(1, 120), (2, 200), (3, 100)], parent=parent_layout, rowSpacing=(1,3))
+            text(label=f"Texture for '{prefix}':", align="right")
+            path_field = text_field(text="No texture selected", editable=False, width=190) 
+            select_button = button(label="Select File...", command=partial(self._on_select_single_texture_click, prefix))
+            set_parent("..")
             
             # Create checkboxes row (both sequence and projection)
-            checkboxes_row = cmds.rowColumnLayout(numberOfColumns=3, columnWidth=[(1, 120), (2, 150), (3, 150)], parent=self.texture_selection_layout, rowSpacing=(1,3))
-            cmds.text(label="", align="left")  # Spacer
-            seq_checkbox = cmds.checkBox(label="is sequence?", value=False, 
-                                       changeCommand=lambda state, p_captured=prefix: self._on_sequence_checkbox_changed(p_captured, state))
-            proj_checkbox = cmds.checkBox(label="Projection?", value=True,  # Default to True for backward compatibility
-                                       changeCommand=lambda state, p_captured=prefix: self._on_projection_checkbox_changed(p_captured, state))
-            cmds.setParent("..")
+            checkboxes_row = row_column_layout(numberOfColumns=3, columnWidth=[(1, 120), (2, 150), (3, 150)], parent=parent_layout, rowSpacing=(1,3))
+            text(label="", align="left")  # Spacer
+            seq_checkbox = check_box(label="is sequence?", value=False, 
+                                  changeCommand=partial(self._on_sequence_checkbox_changed, prefix))
+            proj_checkbox = check_box(label="Projection?", value=True,  # Default to True for backward compatibility
+                                  changeCommand=partial(self._on_projection_checkbox_changed, prefix))
+            set_parent("..")
             
             # Add separator for visual clarity
-            cmds.separator(height=5, style='single', parent=self.texture_selection_layout)
+            separator(height=5, style='single', parent=parent_layout)
 
             self.texture_path_fields[prefix] = path_field
             self.select_texture_buttons[prefix] = select_button
@@ -258,7 +462,9 @@ class TextureRiggerUI:
             prefix (str): Prefix of the texture
             state (bool): New state of the checkbox
         """
-        print(f"Sequence checkbox for '{prefix}' changed to: {state}")
+        if self._ui_building:
+            return
+        log.debug("Sequence checkbox for '%s' changed to: %s", prefix, state)
         
         # Update our data structure
         if prefix in self.textures_data:
@@ -272,23 +478,13 @@ class TextureRiggerUI:
             file_node = self.textures_data[prefix]['file_node']
             slide_ctrl = None
             
-            # Find the slide ctrl for this prefix
-            if prefix in self.follicles_data and self.follicles_data[prefix]['control']:
-                follicle_data = self.follicles_data[prefix]
-                control_name = follicle_data['control']
-                
-                if "_Slide_ctrl" in control_name:
-                    slide_ctrl = control_name
-                else:
-                    # Try to find the Slide ctrl as a child
-                    children = cmds.listRelatives(control_name, allDescendents=True, type="transform") or []
-                    for child in children:
-                        if "_Slide_ctrl" in child:
-                            slide_ctrl = child
-                            break
+            # Slide ctrl is resolved once when the follicle is created
+            follicle_data = self.follicles_data.get(prefix)
+            if follicle_data:
+                slide_ctrl = follicle_data.get('slide_ctrl')
             
             if slide_ctrl and file_node:
-                step3_logic.setup_sequence_texture(file_node, slide_ctrl, state)
+                _step3().setup_sequence_texture(file_node, slide_ctrl, state)
                 if state:
                     self.update_step3_status(f"Activated sequence mode for '{prefix}'", success=True)
                 else:
@@ -302,13 +498,15 @@ class TextureRiggerUI:
             prefix (str): Prefix of the texture
             state (bool): New state of the checkbox
         """
-        print(f"Projection checkbox for '{prefix}' changed to: {state}")
+        if self._ui_building:
+            return
+        log.debug("Projection checkbox for '%s' changed to: %s", prefix, state)
         
         # Update our data structure
         if prefix in self.textures_data:
             self.textures_data[prefix]['use_projection'] = state
 
-    def _on_select_single_texture_click(self, prefix):
+    def _on_select_single_texture_click(self, prefix, *args):
         file_paths = cmds.fileDialog2(fileMode=1, caption=f"Select Texture for Prefix: {prefix}")
         if file_paths and file_paths[0]:
             selected_file = file_paths[0]
@@ -326,45 +524,51 @@ class TextureRiggerUI:
             cmds.warning("No mesh selected or initial locator created. Please complete Step 1.")
             return
         
+        self._ensure_texture_selection_ui()
         if not self.textures_data:
             cmds.warning("No textures selected or locators processed for texture connection.")
             return
 
-        all_successful = True
-        for prefix, tex_data in self.textures_data.items():
-            texture_file_path = tex_data.get('file_path')
-            if not texture_file_path or texture_file_path == "No texture selected":
-                cmds.warning(f"No texture file selected for prefix '{prefix}'. Skipping.")
-                continue
+        # Check every follicle in one query instead of per-prefix objExists calls downstream
+        alive_follicles = self._live(*(info.get('follicle') for info in self.follicles_data.values()))
 
-            follicle_info = self.follicles_data.get(prefix)
-            if not follicle_info:
-                cmds.warning(f"Follicle data not found for prefix '{prefix}'. Cannot connect texture.")
-                all_successful = False
-                continue
-            
-            created_follicle_transform = follicle_info.get('follicle')
-            if not created_follicle_transform:
-                cmds.warning(f"Follicle transform not found for prefix '{prefix}'.")
-                all_successful = False
-                continue
+        all_successful = True
+        run_step3 = _step3().run_step3_logic
+        run_step3_uv = _step3_uv().run_step3_uv_logic
+        follicles_data = self.follicles_data
+
+        with _suspend_refresh("connectTextures"):
+            for prefix, tex_data in self.textures_data.items():
+                texture_file_path = tex_data.get('file_path')
+                if not texture_file_path or texture_file_path == "No texture selected":
+                    cmds.warning(f"No texture file selected for prefix '{prefix}'. Skipping.")
+                    continue
+
+                follicle_info = follicles_data.get(prefix)
+                if not follicle_info:
+                    cmds.warning(f"Follicle data not found for prefix '{prefix}'. Cannot connect texture.")
+                    all_successful = False
+                    continue
             
-            # Get flags
-            is_sequence = tex_data.get('is_sequence', False)
-            use_projection = tex_data.get('use_projection', True)
+                created_follicle_transform = follicle_info.get('follicle')
+                if not created_follicle_transform or created_follicle_transform not in alive_follicles:
+                    cmds.warning(f"Follicle transform not found for prefix '{prefix}'.")
+                    all_successful = False
+                    continue
             
-            if use_projection:
-                # Use original projection-based method
-                file_node, projection_node, place2d_node, place3d_node, layered_texture_node, material_node, updated_mesh_transform = step3_logic.run_step3_logic(
+                # Projection-based method by default, UV-based method otherwise.
+                # The UV method returns None for projection_node and place3d_node.
+                run_step = run_step3 if tex_data.get('use_projection', True) else run_step3_uv
+                file_node, projection_node, place2d_node, place3d_node, layered_texture_node, material_node, updated_mesh_transform = run_step(
                     mesh_transform=self.selected_mesh_transform,
                     image_file_path=texture_file_path,
                     name_prefix=prefix,
                     follicle_transform=created_follicle_transform,
-                    is_sequence=is_sequence
+                    is_sequence=tex_data.get('is_sequence', False)
                 )
                 
                 if file_node:
-                    self.textures_data[prefix].update({
+                    tex_data.update({
                         'file_node': file_node,
                         'projection_node': projection_node,
                         'place2d_node': place2d_node,
@@ -376,29 +580,6 @@ class TextureRiggerUI:
                 else:
                     cmds.warning(f"Texture connection failed for prefix '{prefix}'.")
                     all_successful = False
-            else:
-                # Use UV-based method
-                file_node, projection_node, place2d_node, place3d_node, layered_texture_node, material_node, updated_mesh_transform = step3_uv_logic.run_step3_uv_logic(
-                    mesh_transform=self.selected_mesh_transform,
-                    image_file_path=texture_file_path,
-                    name_prefix=prefix,
-                    follicle_transform=created_follicle_transform,
-                    is_sequence=is_sequence
-                )
-                
-                if file_node:
-                    self.textures_data[prefix].update({
-                        'file_node': file_node,
-                        'projection_node': projection_node,  # Will be None for UV method
-                        'place2d_node': place2d_node,
-                        'place3d_node': place3d_node,  # Will be None for UV method
-                        'layered_texture_node': layered_texture_node,
-                        'material_node': material_node
-                    })
-                    self.selected_mesh_transform = updated_mesh_transform
-                else:
-                    cmds.warning(f"Texture connection failed for prefix '{prefix}'.")
-                    all_successful = False
 
         if all_successful:
             cmds.headsUpMessage(f"All selected textures connected and scene organized.", time=5.0)
@@ -407,21 +588,25 @@ class TextureRiggerUI:
             cmds.warning("Some textures could not be connected. Check the script editor.")
 
     def reset_step2_and_beyond(self):
-        cmds.frameLayout(self.step2_frame, edit=True, enable=False)
-        cmds.button(self.create_follicles_button, edit=True, enable=True)
-        self.update_step2_status("Waiting for locator positioning and follicle creation...")
-        self.follicles_data.clear()
-
-        cmds.frameLayout(self.step3_frame, edit=True, enable=False)
-        children = cmds.columnLayout(self.texture_selection_layout, query=True, childArray=True) or []
-        for child in children: cmds.deleteUI(child)
-        self.texture_path_fields.clear()
-        self.select_texture_buttons.clear()
-        self.sequence_checkboxes.clear()
-        self.projection_checkboxes.clear()
-        cmds.button(self.connect_all_textures_button, edit=True, enable=False)
-        self.update_step3_status("Waiting for follicle creation to enable texture selection...")
-        self.textures_data.clear()
+        with self._batched_ui_edit("resetTexUI"):
+            self._set_enabled(cmds.frameLayout, self.step2_frame, False)
+            self._set_enabled(cmds.button, self.create_follicles_button, True)
+            self.update_step2_status("Waiting for locator positioning and follicle creation...")
+            self.follicles_data.clear()
+            self._active_prefixes = set(self.locators_data)
+
+            self._set_enabled(cmds.frameLayout, self.step3_frame, False)
+            children = cmds.columnLayout(self.texture_selection_layout, query=True, childArray=True) or []
+            if children:
+                cmds.deleteUI(*children)
+            self.texture_path_fields.clear()
+            self.select_texture_buttons.clear()
+            self.sequence_checkboxes.clear()
+            self.projection_checkboxes.clear()
+            self._set_enabled(cmds.button, self.connect_all_textures_button, False)
+            self.update_step3_status("Waiting for follicle creation to enable texture selection...")
+            self.textures_data.clear()
+            self._step3_dirty = False
 
     def reset_tool_state(self):
         self.selected_mesh_transform = None
@@ -432,12 +617,13 @@ class TextureRiggerUI:
         
         self.reset_step2_and_beyond()
 
-        cmds.button(self.select_mesh_button, edit=True, enable=True)
-        cmds.button(self.create_locator_button, edit=True, enable=False)
+        self._set_enabled(cmds.button, self.select_mesh_button, True)
+        self._set_enabled(cmds.button, self.create_locator_button, False)
         
         default_prefix = "Prefix"
         self.name_prefix = default_prefix
-        cmds.textField(self.name_field, edit=True, text=default_prefix, enable=True)
+        cmds.textField(self.name_field, edit=True, text=default_prefix)
+        self._set_enabled(cmds.textField, self.name_field, True)
         
         self.update_step1_status("Waiting for mesh selection...")
         step1_logic.clear_reference_follicle()
@@ -446,18 +632,27 @@ class TextureRiggerUI:
         self.reset_step2_and_beyond()
         step1_logic.clear_reference_follicle()
         
-        selected_objects = cmds.ls(selection=True, transforms=True)
-        if not selected_objects:
+        selection = om.MGlobal.getActiveSelectionList()
+        if selection.isEmpty():
             self.update_step1_status("No objects selected. Please select a mesh.", success=False)
             return
 
+        # Walk the selection through the API to avoid per-object listRelatives/objectType commands
         mesh_transform = mesh_shape = None
-        for obj in selected_objects:
-            shapes = cmds.listRelatives(obj, shapes=True) or []
-            for shape in shapes:
-                if cmds.objectType(shape, isType="mesh"):
-                    mesh_transform = obj
-                    mesh_shape = shape
+        for i in range(selection.length()):
+            try:
+                dag_path = selection.getDagPath(i)
+            except TypeError:
+                continue  # Not a DAG node
+            if not dag_path.node().hasFn(om.MFn.kTransform):
+                continue
+            for child_index in range(dag_path.childCount()):
+                child = dag_path.child(child_index)
+                if child.apiType() == om.MFn.kMesh:
+                    shape_path = om.MDagPath(dag_path)
+                    shape_path.push(child)
+                    mesh_transform = dag_path.partialPathName()
+                    mesh_shape = shape_path.partialPathName()
                     break
             if mesh_transform: break
         
@@ -473,12 +668,13 @@ class TextureRiggerUI:
         self.selected_mesh_transform = mesh_transform
         self.selected_mesh_shape = mesh_shape
         
-        follicle_transform, follicle_shape, null_group = step1_logic.create_reference_follicle(
-            mesh_transform, mesh_shape)
+        with _suspend_refresh("createReferenceFollicle", light=True):
+            follicle_transform, follicle_shape, null_group = step1_logic.create_reference_follicle(
+                mesh_transform, mesh_shape)
         
         if follicle_transform and null_group:
             self.update_step1_status(f"Mesh '{mesh_transform}' selected and reference follicle created.", success=True)
-            cmds.button(self.create_locator_button, edit=True, enable=True)
+            self._set_enabled(cmds.button, self.create_locator_button, True)
         else:
             self.update_step1_status("Failed to create reference follicle.", success=False)
     
@@ -488,7 +684,6 @@ class TextureRiggerUI:
             return
 
         current_prefix = cmds.textField(self.name_field, query=True, text=True)
-        self.name_prefix = current_prefix
         
         if not current_prefix or current_prefix.isspace():
             self.update_step1_status("Prefix cannot be empty.", success=False)
@@ -502,27 +697,28 @@ class TextureRiggerUI:
         
         if locator:
             self.locators_data[current_prefix] = locator
-            self._update_locator_list_widget()
+            self._active_prefixes.add(current_prefix)
+            self._append_locator_list_row(current_prefix, locator)
             self.update_step1_status(f"Added locator '{locator}'.", success=True)
             
-            if current_prefix.endswith('_1'): next_prefix = f"{current_prefix[:-2]}_2"
-            elif current_prefix.endswith('_2'): next_prefix = f"{current_prefix[:-2]}_3"
-            elif current_prefix.endswith('_3'): next_prefix = f"{current_prefix[:-2]}_4"
-            elif current_prefix.endswith('_4'): next_prefix = f"{current_prefix[:-2]}_5"
-            else: next_prefix = f"{current_prefix}_1"
-                
+            next_prefix = _suffix_next_prefix(current_prefix)
             cmds.textField(self.name_field, edit=True, text=next_prefix)
             self.name_prefix = next_prefix
             
-            cmds.frameLayout(self.step2_frame, edit=True, enable=True)
+            self._set_enabled(cmds.frameLayout, self.step2_frame, True)
             self.update_step2_status("Move locators. Create more or proceed to create follicles.")
         else:
             self.update_step1_status(f"Failed to add locator with prefix '{current_prefix}'.", success=False)
 
+_tool_ui = None
+
 def show_ui():
-    tool_ui = TextureRiggerUI()
-    tool_ui.create_ui()
-    return tool_ui
+    global _tool_ui
+    # Reuse the instance that owns the open window so its widgets and callbacks stay valid
+    if _tool_ui is None or not cmds.window(_tool_ui.window_name, exists=True):
+        _tool_ui = TextureRiggerUI()
+    _tool_ui.create_ui()
+    return _tool_ui
 
 if __name__ == "__main__":
     ui_instance = show_ui()
@@ -4,9 +4,9 @@ This script is executed by install.mel.
 Copyright 2025 by Hasan Çivili. All Rights Reserved. (Adapted for 2D Texture Rigger)
 """
 import os
-import sys
 import maya.cmds as cmds
-import maya.mel as mel
+
+_WIN_TO_POSIX = str.maketrans('\\', '/')
 
 def create_texture_rigger_shelf_button(install_script_path):
     """Creates a shelf button for the 2D Texture Rigger."""
@@ -46,56 +46,39 @@ def create_texture_rigger_shelf_button(install_script_path):
                 cmds.shelfLayout(shelf_name, parent="ShelfLayout") # Maya's main shelf area
 
         # Ensure script_dir_norm uses forward slashes for the Python command string, or is a raw string
-        escaped_tool_dir = script_dir_norm.replace("\\\\", "/").replace("\\", "/")
+        escaped_tool_dir = script_dir_norm.translate(_WIN_TO_POSIX)
+
+        launcher_module_name = "texture_rigger_launcher"
+        if not os.path.exists(os.path.join(script_dir_norm, launcher_module_name + ".py")):
+            cmds.warning(f"2D Texture Rigger Installer: Launcher script '{launcher_module_name}.py' not found in: {script_dir_norm}")
+            return
 
         # This is the command that the shelf button will execute.
-        # It correctly imports 'TextureRiggerTool' and calls its 'show_ui' function.
+        # The import and error handling live in texture_rigger_launcher.py, so the shelf
+        # only compiles these few lines per click and the launcher is cached as bytecode.
         shelf_command = f"""
 import sys
-import os
-import maya.cmds as cmds
-import importlib
-
 tool_dir = r'{escaped_tool_dir}'
-tool_module_name = '{tool_module_name}'
-
 if tool_dir not in sys.path:
     sys.path.append(tool_dir)
-
-try:
-    # Dynamically import the module
-    module_to_run = importlib.import_module(tool_module_name)
-    # Reload for development convenience
-    importlib.reload(module_to_run)
-    # Call the UI function
-    module_to_run.show_ui()
-except ImportError as e_import:
-    error_msg = f"2D Texture Rigger: IMPORT ERROR - {{e_import}}. Could not import '{{tool_module_name}}'. Ensure it is in: {{tool_dir}}."
-    print(error_msg)
-    cmds.warning(error_msg)
-except AttributeError as e_attr:
-    error_msg = f"2D Texture Rigger: ATTRIBUTE ERROR - {{e_attr}}. Could not find 'show_ui' in '{{tool_module_name}}'."
-    print(error_msg)
-    cmds.warning(error_msg)
-except Exception as e_runtime:
-    error_msg = f"2D Texture Rigger: RUNTIME ERROR - {{e_runtime}}."
-    print(error_msg)
-    cmds.warning(error_msg)
+import {launcher_module_name}
+{launcher_module_name}.launch()
 """
 
         # Check if a button with this label already exists on the shelf
         shelf_buttons = cmds.shelfLayout(shelf_name, query=True, childArray=True) or []
         existing_button = None
         for btn in shelf_buttons:
-            try:
-                if cmds.shelfButton(btn, query=True, label=True) == "2D Texture Rigger": # Check for old or default label
-                    existing_button = btn
-                    break
-                if cmds.shelfButton(btn, query=True, command=True) == shelf_command: # More robust check by command
-                    existing_button = btn
-                    break
-            except RuntimeError: # Button might not be a shelfButton or might be deleted
-                pass
+            if cmds.objectTypeUI(btn) != "shelfButton": # Skip separators and other shelf controls
+                continue
+            if cmds.shelfButton(btn, query=True, label=True) == "2D Texture Rigger": # Check for old or default label
+                existing_button = btn
+                break
+            btn_command = cmds.shelfButton(btn, query=True, command=True) or ""
+            # Same command, or an older inline command that launched the tool from this folder
+            if btn_command == shelf_command or (f"'{tool_module_name}'" in btn_command and escaped_tool_dir in btn_command):
+                existing_button = btn
+                break
 
         button_label = "Texture Rigger" # <<< YENİ ETİKETİNİZİ BURAYA GİRİN
 
@@ -1,5 +1,5 @@
 import maya.cmds as cmds
-import maya.OpenMaya as om
+import maya.api.OpenMaya as om
 
 # Module-level variables to store reference objects
 _ref_follicle_transform = None
@@ -7,6 +7,7 @@ _ref_follicle_shape = None
 _ref_null_group = None
 _ref_mesh_transform = None
 _ref_mesh_shape = None
+_ref_out_translate_plug = None
 
 def has_uv_map(mesh_shape):
     """
@@ -23,19 +24,11 @@ def has_uv_map(mesh_shape):
         
     # Check if the mesh has UVs
     try:
-        # Method 1: Check if polyEvaluate returns UV values
-        uv_count = cmds.polyEvaluate(mesh_shape, uv=True)
-        if isinstance(uv_count, (int, float)) and uv_count > 0:
-            return True
-            
-        # Method 2: Try to get UV sets
-        uv_sets = cmds.polyUVSet(mesh_shape, query=True, allUVSets=True)
-        if uv_sets and len(uv_sets) > 0:
-            # Check if any UV in the first set
-            uv_count = cmds.polyEvaluate(mesh_shape, uvcoord=True)
-            return isinstance(uv_count, (int, float)) and uv_count > 0
-            
-        return False
+        sel = om.MSelectionList()
+        sel.add(mesh_shape)
+        mesh_fn = om.MFnMesh(sel.getDagPath(0))
+        # Read the UV counts straight from the mesh instead of polyEvaluate/polyUVSet round trips
+        return any(mesh_fn.numUVs(uv_set) > 0 for uv_set in mesh_fn.getUVSetNames())
     except Exception as e:
         print(f"Error checking UV map for mesh '{mesh_shape}': {e}")
         return False
@@ -51,7 +44,7 @@ def create_reference_follicle(mesh_transform, mesh_shape):
     Returns:
         tuple: (follicle_transform, follicle_shape, null_group) or (None, None, None) if failed
     """
-    global _ref_follicle_transform, _ref_follicle_shape, _ref_null_group
+    global _ref_follicle_transform, _ref_follicle_shape, _ref_null_group, _ref_out_translate_plug
     
     # Check if mesh exists
     if not cmds.objExists(mesh_shape):
@@ -89,6 +82,11 @@ def create_reference_follicle(mesh_transform, mesh_shape):
         _ref_follicle_transform = follicle_transform
         _ref_follicle_shape = follicle_shape
         _ref_null_group = null_group
+        # The null sits at the origin of the unparented follicle transform, so its world
+        # position is the follicle's outTranslate
+        sel = om.MSelectionList()
+        sel.add(follicle_shape)
+        _ref_out_translate_plug = om.MFnDependencyNode(sel.getDependNode(0)).findPlug("outTranslate", False)
         
         return follicle_transform, follicle_shape, null_group
         
@@ -106,7 +104,7 @@ def create_locator_at_null_position(name_prefix):
     Returns:
         str: Name of the created locator or None if failed
     """
-    global _ref_null_group
+    global _ref_null_group, _ref_out_translate_plug
     
     if not _ref_null_group or not cmds.objExists(_ref_null_group):
         cmds.warning("Reference null group does not exist. Please select mesh first.")
@@ -114,14 +112,17 @@ def create_locator_at_null_position(name_prefix):
     
     try:
         # Get world position of null group
-        null_world_pos = cmds.xform(_ref_null_group, query=True, worldSpace=True, translation=True)
+        if _ref_out_translate_plug is not None:
+            null_world_pos = [_ref_out_translate_plug.child(i).asDouble() for i in range(3)]
+        else:
+            null_world_pos = cmds.xform(_ref_null_group, query=True, worldSpace=True, translation=True)
         
         # Create locator in world space (not parented to follicle)
         locator_name = f"{name_prefix}_locator"
         locator = cmds.spaceLocator(name=locator_name)[0]
         
-        # Position locator at null's world position
-        cmds.xform(locator, translation=null_world_pos, worldSpace=True)
+        # Locator is created unparented, so its translate is its world position
+        cmds.setAttr(f"{locator}.translate", *null_world_pos, type="double3")
         
         print(f"Created locator '{locator}' at position: {null_world_pos}")
         return locator
@@ -178,7 +179,7 @@ def clear_reference_follicle():
     Clears the stored references to the follicle and null group.
     This should be called when resetting the tool state.
     """
-    global _ref_follicle_transform, _ref_follicle_shape, _ref_null_group, _ref_mesh_transform, _ref_mesh_shape
+    global _ref_follicle_transform, _ref_follicle_shape, _ref_null_group, _ref_mesh_transform, _ref_mesh_shape, _ref_out_translate_plug
     
     if _ref_follicle_transform and cmds.objExists(_ref_follicle_transform):
         try:
@@ -191,6 +192,7 @@ def clear_reference_follicle():
     _ref_follicle_transform = None
     _ref_follicle_shape = None
     _ref_null_group = None 
+    _ref_out_translate_plug = None
     _ref_mesh_transform = None
     _ref_mesh_shape = None
     print("Cleared all reference follicle data")
@@ -1,5 +1,9 @@
+import logging
 import maya.cmds as cmds
-import maya.OpenMaya as om
+import maya.api.OpenMaya as om
+
+# Per-follicle progress goes to the debug log so large batches don't flood the Script Editor
+log = logging.getLogger("TextureRigger")
 
 def get_uv_at_point(mesh_shape, world_point_mvector):
     """
@@ -19,65 +23,65 @@ def get_uv_at_point(mesh_shape, world_point_mvector):
         cmds.warning(f"Mesh shape '{mesh_shape}' could not be selected.")
         return None
 
-    dag_path = om.MDagPath()
     try:
-        selection_list.getDagPath(0, dag_path)
-    except RuntimeError:
+        dag_path = selection_list.getDagPath(0)
+    except (RuntimeError, TypeError):
         cmds.warning(f"Could not get DAG path for mesh shape '{mesh_shape}'.")
         return None
 
     # World space point as MPoint
     world_m_point = om.MPoint(world_point_mvector.x, world_point_mvector.y, world_point_mvector.z)
 
-    cpos_node = None # Define here so it can be deleted in case of error
     try:
-        # Create closestPointOnMesh node
-        cpos_node = cmds.createNode("closestPointOnMesh")
-        
-        # Get mesh transform node
-        mesh_transform = cmds.listRelatives(mesh_shape, parent=True, fullPath=True)[0]
-        
-        # Connect worldMatrix of mesh transform to node
-        cmds.connectAttr(f"{mesh_transform}.worldMatrix[0]", f"{cpos_node}.inputMatrix")
-        
-        # Mesh connection
-        mesh_attr_to_connect = ""
-        if cmds.attributeQuery("worldMesh", node=mesh_shape, exists=True) and \
-           cmds.attributeQuery("worldMesh[0]", node=mesh_shape, exists=True):
-            mesh_attr_to_connect = f"{mesh_shape}.worldMesh[0]"
-        elif cmds.attributeQuery("outMesh", node=mesh_shape, exists=True):
-            mesh_attr_to_connect = f"{mesh_shape}.outMesh"
-        else:
-            cmds.warning(f"Could not find appropriate mesh output attribute on mesh shape '{mesh_shape}' (worldMesh[0] or outMesh).")
-            if cpos_node and cmds.objExists(cpos_node): cmds.delete(cpos_node)
-            return None
-            
-        cmds.connectAttr(mesh_attr_to_connect, f"{cpos_node}.inMesh")
-        
-        # Set input position (world space)
-        cmds.setAttr(f"{cpos_node}.inPositionX", world_point_mvector.x)
-        cmds.setAttr(f"{cpos_node}.inPositionY", world_point_mvector.y)
-        cmds.setAttr(f"{cpos_node}.inPositionZ", world_point_mvector.z)
-        
-        # Get UV coordinates
-        u_val = cmds.getAttr(f"{cpos_node}.result.parameterU")
-        v_val = cmds.getAttr(f"{cpos_node}.result.parameterV")
-        
-        if u_val is not None and v_val is not None:
-            print(f"Found UV coordinates ({u_val}, {v_val}) for point ({world_point_mvector.x}, {world_point_mvector.y}, {world_point_mvector.z})")
-            return float(u_val), float(v_val)
-        else:
-            cmds.warning(f"Could not get UV coordinates using closestPointOnMesh node.")
-            return None
+        # Query the closest UV directly on the mesh instead of building a temporary closestPointOnMesh node
+        mesh_fn = om.MFnMesh(dag_path)
+        u_val, v_val, _face_id = mesh_fn.getUVAtPoint(world_m_point, om.MSpace.kWorld)
+        log.debug("Found UV coordinates (%s, %s) for point (%s, %s, %s)", u_val, v_val, world_point_mvector.x, world_point_mvector.y, world_point_mvector.z)
+        return float(u_val), float(v_val)
 
     except Exception as e:
         cmds.warning(f"Error getting UV from world point: {e}")
         return None
-    finally:
-        if cpos_node and cmds.objExists(cpos_node):
-            cmds.delete(cpos_node)
 
-def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textureRigger"):
+def get_mesh_connection_sources(mesh_shape_name):
+    """
+    Resolves the mesh transform and output attribute that follicles on this mesh are driven by.
+    
+    Args:
+        mesh_shape_name (str): Name of the mesh shape node.
+    
+    Returns:
+        tuple: (mesh_transform_name, mesh_output_attr) or (None, None) if the mesh has no usable output
+    """
+    if cmds.attributeQuery("worldMesh", node=mesh_shape_name, exists=True):
+        mesh_output_attr = f"{mesh_shape_name}.worldMesh[0]"
+    elif cmds.attributeQuery("outMesh", node=mesh_shape_name, exists=True):
+        mesh_output_attr = f"{mesh_shape_name}.outMesh"
+    else:
+        return None, None
+    # The parent transform is one step up the shape's DAG path
+    selection_list = om.MSelectionList()
+    selection_list.add(mesh_shape_name)
+    mesh_dag_path = selection_list.getDagPath(0)
+    mesh_dag_path.pop()
+    return mesh_dag_path.fullPathName(), mesh_output_attr
+
+def create_follicle_parent_group(follicle_transform_name, name_prefix="textureRigger"):
+    """
+    Creates the empty "parent_grp" group (null group) inside a follicle.
+    
+    Args:
+        follicle_transform_name (str): Name of the follicle transform node.
+        name_prefix (str, optional): Name prefix for the group. Defaults to "textureRigger".
+    
+    Returns:
+        str: Name of the created group.
+    """
+    clean_prefix = name_prefix if name_prefix else "textureRigger"
+    # Created directly under the follicle, so it starts with an identity local transform
+    return cmds.group(empty=True, name=f"{clean_prefix}_parent_grp#", parent=follicle_transform_name)
+
+def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textureRigger", mesh_sources=None, skip_parent_grp=False):
     """
     Creates a follicle and a null group inside it on the specified mesh at the given UV coordinates.
     
@@ -86,6 +90,8 @@ def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textur
         u_coord (float): U coordinate.
         v_coord (float): V coordinate.
         name_prefix (str, optional): Name prefix for the follicle. Defaults to "textureRigger".
+        mesh_sources (tuple, optional): Result of get_mesh_connection_sources, resolved here if not given.
+        skip_parent_grp (bool, optional): Don't create the null group; parent_group_name is then None.
     
     Returns:
         tuple: (follicle_transform_name, parent_group_name) or (None, None)
@@ -94,6 +100,11 @@ def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textur
         cmds.warning(f"Mesh shape '{mesh_shape_name}' not found for creating follicle.")
         return None, None
 
+    mesh_transform_name, mesh_output_attr = mesh_sources or get_mesh_connection_sources(mesh_shape_name)
+    if not mesh_output_attr:
+        cmds.warning(f"Could not find appropriate output attribute on mesh '{mesh_shape_name}' for follicle.")
+        return None, None
+
     # Clean and use the name prefix
     clean_prefix = name_prefix if name_prefix else "textureRigger"
     follicle_name = f"{clean_prefix}_follicle#"
@@ -102,20 +113,10 @@ def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textur
     follicle_transform_name = cmds.createNode("transform", name=follicle_name)
     follicle_shape_name = cmds.createNode("follicle", name=f"{follicle_transform_name}Shape", parent=follicle_transform_name)
 
-    # Mesh connections
     # Connect mesh's worldMesh or outMesh attribute to follicle's inputMesh
-    if cmds.attributeQuery("worldMesh", node=mesh_shape_name, exists=True) and \
-       cmds.attributeQuery("worldMesh[0]", node=mesh_shape_name, exists=True):
-        cmds.connectAttr(f"{mesh_shape_name}.worldMesh[0]", f"{follicle_shape_name}.inputMesh")
-    elif cmds.attributeQuery("outMesh", node=mesh_shape_name, exists=True):
-        cmds.connectAttr(f"{mesh_shape_name}.outMesh", f"{follicle_shape_name}.inputMesh")
-    else:
-        cmds.warning(f"Could not find appropriate output attribute on mesh '{mesh_shape_name}' for follicle.")
-        cmds.delete(follicle_transform_name)
-        return None, None
+    cmds.connectAttr(mesh_output_attr, f"{follicle_shape_name}.inputMesh")
 
     # Connect mesh's worldMatrix to follicle's inputWorldMatrix
-    mesh_transform_name = cmds.listRelatives(mesh_shape_name, parent=True, fullPath=True)[0]
     cmds.connectAttr(f"{mesh_transform_name}.worldMatrix[0]", f"{follicle_shape_name}.inputWorldMatrix")
 
     # Connect follicle's outTranslate and outRotate to transform node
@@ -126,15 +127,13 @@ def create_follicle_at_uv(mesh_shape_name, u_coord, v_coord, name_prefix="textur
     cmds.setAttr(f"{follicle_shape_name}.parameterU", u_coord)
     cmds.setAttr(f"{follicle_shape_name}.parameterV", v_coord)
 
-    # Create an empty "parent_grp" group (null group) inside the follicle
-    parent_grp_name = cmds.group(empty=True, name=f"{clean_prefix}_parent_grp#")
-    cmds.parent(parent_grp_name, follicle_transform_name)
-    # Reset the group (relative to follicle)
-    cmds.setAttr(f"{parent_grp_name}.translate", 0, 0, 0)
-    cmds.setAttr(f"{parent_grp_name}.rotate", 0, 0, 0)
-    cmds.setAttr(f"{parent_grp_name}.scale", 1, 1, 1)
+    if skip_parent_grp:
+        log.debug("Follicle '%s' created at UV (%s, %s).", follicle_transform_name, u_coord, v_coord)
+        return follicle_transform_name, None
 
-    print(f"Follicle '{follicle_transform_name}' and parent group '{parent_grp_name}' created at UV ({u_coord}, {v_coord}).")
+    parent_grp_name = create_follicle_parent_group(follicle_transform_name, clean_prefix)
+
+    log.debug("Follicle '%s' and parent group '%s' created at UV (%s, %s).", follicle_transform_name, parent_grp_name, u_coord, v_coord)
     return follicle_transform_name, parent_grp_name
 
 def setup_follicle_connections(follicle_transform, follicle_shape, node_prefix):
@@ -167,35 +166,36 @@ def setup_follicle_connections(follicle_transform, follicle_shape, node_prefix):
         cmds.connectAttr(f"{follicle_transform}.parentInverseMatrix[0]", f"{mult_matrix_node}.matrixIn[1]", force=True)
         cmds.connectAttr(f"{mult_matrix_node}.matrixSum", f"{decompose_matrix_node}.inputMatrix", force=True)
 
-        # Unlock translate and rotate locks
-        for attr_comp in ["translate", "rotate"]:
-            for axis in ["X", "Y", "Z"]:
-                attr_full_name = f"{follicle_transform}.{attr_comp}{axis}"
-                if cmds.getAttr(attr_full_name, lock=True):
-                    cmds.setAttr(attr_full_name, lock=False)
+        # Unlock translate and rotate locks (unlocking an unlocked attribute is a no-op, so no lock query first)
+        for attr in ("tx", "ty", "tz", "rx", "ry", "rz"):
+            cmds.setAttr(f"{follicle_transform}.{attr}", lock=False)
 
-        # Remove existing connections
-        if cmds.isConnected(f"{follicle_shape}.outTranslate", f"{follicle_transform}.translate"):
-            cmds.disconnectAttr(f"{follicle_shape}.outTranslate", f"{follicle_transform}.translate")
-        if cmds.isConnected(f"{follicle_shape}.outRotate", f"{follicle_transform}.rotate"):
-            cmds.disconnectAttr(f"{follicle_shape}.outRotate", f"{follicle_transform}.rotate")
+        # Remove existing connections (disconnectAttr raises if they are not there, which is fine)
+        for src, dst in ((f"{follicle_shape}.outTranslate", f"{follicle_transform}.translate"),
+                         (f"{follicle_shape}.outRotate", f"{follicle_transform}.rotate")):
+            try:
+                cmds.disconnectAttr(src, dst)
+            except RuntimeError:
+                pass
 
         cmds.connectAttr(f"{decompose_matrix_node}.outputTranslate", f"{follicle_transform}.translate", force=True)
         cmds.connectAttr(f"{decompose_matrix_node}.outputRotate", f"{follicle_transform}.rotate", force=True)
 
         position_grp = cmds.group(empty=True, name=f"{base_name}_position_grp", parent=follicle_transform)
         invert_grp = cmds.group(empty=True, name=f"{base_name}_Invert_grp", parent=position_grp)
-        slide_ctrl_result = cmds.circle(name=f"{base_name}_Slide_ctrl", normal=(0, 1, 0), radius=1)
+        # Built in its final shape: radius 3, facing +Z and offset 0.02 off the surface,
+        # so the CVs never need editing after creation
+        slide_ctrl_result = cmds.circle(name=f"{base_name}_Slide_ctrl", normal=(0, 0, 1), radius=3, center=(0, 0, 0.02))
         
         if not slide_ctrl_result:
             cmds.warning("Failed to create Slide_ctrl.")
             return None, None
             
         slide_ctrl = slide_ctrl_result[0]
-        cmds.parent(slide_ctrl, invert_grp)
+        # Relative parenting keeps the circle's identity local transform, so it lands on invert_grp's origin
+        cmds.parent(slide_ctrl, invert_grp, relative=True)
 
-        cmds.addAttr(slide_ctrl, longName="Precision", attributeType="float", defaultValue=0.8)
-        cmds.setAttr(f"{slide_ctrl}.Precision", keyable=True)
+        cmds.addAttr(slide_ctrl, longName="Precision", attributeType="float", defaultValue=0.8, keyable=True)
 
         translate_invert_node = cmds.createNode("multiplyDivide", name=f"{base_name}_Translate_Invert")
         cmds.setAttr(f"{translate_invert_node}.input2X", -1)
@@ -204,49 +204,31 @@ def setup_follicle_connections(follicle_transform, follicle_shape, node_prefix):
         cmds.connectAttr(f"{slide_ctrl}.translate", f"{translate_invert_node}.input1", force=True)
         cmds.connectAttr(f"{translate_invert_node}.output", f"{invert_grp}.translate", force=True)
 
-        invert_v_node = cmds.createNode("multDoubleLinear", name=f"{base_name}_Invert_V")
-        invert_u_node = cmds.createNode("multDoubleLinear", name=f"{base_name}_Invert_U")
-        cmds.connectAttr(f"{slide_ctrl}.translateX", f"{invert_v_node}.input1", force=True)
-        cmds.connectAttr(f"{slide_ctrl}.translateY", f"{invert_u_node}.input1", force=True)
-        cmds.setAttr(f"{invert_v_node}.input2", 1)
-        cmds.setAttr(f"{invert_u_node}.input2", 1)
-
-        precision_v_node = cmds.createNode("multDoubleLinear", name=f"{base_name}_Precision_V")
-        precision_u_node = cmds.createNode("multDoubleLinear", name=f"{base_name}_Precision_U")
-        cmds.connectAttr(f"{invert_v_node}.output", f"{precision_v_node}.input1", force=True)
-        cmds.connectAttr(f"{invert_u_node}.output", f"{precision_u_node}.input1", force=True)
-        cmds.connectAttr(f"{slide_ctrl}.Precision", f"{precision_v_node}.input2", force=True)
-        cmds.connectAttr(f"{slide_ctrl}.Precision", f"{precision_u_node}.input2", force=True)
-
-        pos_v_node = cmds.createNode("addDoubleLinear", name=f"{base_name}_pos_U_driver")  # For U
-        pos_u_node = cmds.createNode("addDoubleLinear", name=f"{base_name}_pos_V_driver")  # For V
-        cmds.connectAttr(f"{precision_v_node}.output", f"{pos_v_node}.input1", force=True)
-        cmds.connectAttr(f"{precision_u_node}.output", f"{pos_u_node}.input1", force=True)
+        # X drives U and Y drives V; one vector node per stage instead of a scalar node per axis
+        precision_node = cmds.createNode("multiplyDivide", name=f"{base_name}_Precision")
+        cmds.connectAttr(f"{slide_ctrl}.translateX", f"{precision_node}.input1X", force=True)
+        cmds.connectAttr(f"{slide_ctrl}.translateY", f"{precision_node}.input1Y", force=True)
+        cmds.connectAttr(f"{slide_ctrl}.Precision", f"{precision_node}.input2X", force=True)
+        cmds.connectAttr(f"{slide_ctrl}.Precision", f"{precision_node}.input2Y", force=True)
+
+        pos_driver_node = cmds.createNode("plusMinusAverage", name=f"{base_name}_pos_UV_driver")
+        cmds.connectAttr(f"{precision_node}.output", f"{pos_driver_node}.input3D[0]", force=True)
 
         # Get current UV values of the follicle shape
         param_u = cmds.getAttr(f"{follicle_shape}.parameterU")
         param_v = cmds.getAttr(f"{follicle_shape}.parameterV")
 
-        # Set AddDoubleLinear input2 values (current UV positions)
-        cmds.setAttr(f"{pos_v_node}.input2", param_u)
-        cmds.setAttr(f"{pos_u_node}.input2", param_v)
+        # Offset by the current UV positions
+        cmds.setAttr(f"{pos_driver_node}.input3D[1]", param_u, param_v, 0, type="double3")
 
         clamp_node = cmds.createNode("clamp", name=f"{base_name}_clamp")
-        cmds.connectAttr(f"{pos_v_node}.output", f"{clamp_node}.inputR", force=True)  # inputR for U
-        cmds.connectAttr(f"{pos_u_node}.output", f"{clamp_node}.inputG", force=True)  # inputG for V
-        cmds.setAttr(f"{clamp_node}.minR", 0)
-        cmds.setAttr(f"{clamp_node}.minG", 0)
-        cmds.setAttr(f"{clamp_node}.minB", 0)
-        cmds.setAttr(f"{clamp_node}.maxR", 1)
-        cmds.setAttr(f"{clamp_node}.maxG", 1)
-        cmds.setAttr(f"{clamp_node}.maxB", 1)
+        cmds.connectAttr(f"{pos_driver_node}.output3Dx", f"{clamp_node}.inputR", force=True)  # inputR for U
+        cmds.connectAttr(f"{pos_driver_node}.output3Dy", f"{clamp_node}.inputG", force=True)  # inputG for V
+        cmds.setAttr(f"{clamp_node}.min", 0, 0, 0, type="double3")
+        cmds.setAttr(f"{clamp_node}.max", 1, 1, 1, type="double3")
         cmds.connectAttr(f"{clamp_node}.outputR", f"{follicle_shape}.parameterU", force=True)
         cmds.connectAttr(f"{clamp_node}.outputG", f"{follicle_shape}.parameterV", force=True)
 
-        cmds.setAttr(f"{slide_ctrl}.translate", 0, 0, 0, type="double3")
-        cmds.setAttr(f"{slide_ctrl}.rotate", 0, 0, 0, type="double3")
-        cmds.makeIdentity(slide_ctrl, apply=True, translate=True, rotate=True, scale=False)
-
         cmds.setAttr(f"{position_grp}.rotateZ", 180)
         cmds.setAttr(f"{position_grp}.translateZ", 0)
         cmds.setAttr(f"{position_grp}.scale", 1, 1, 1, type="double3")
@@ -266,45 +248,14 @@ def setup_follicle_connections(follicle_transform, follicle_shape, node_prefix):
             cmds.setAttr(f"{bind_joint}.rotate", 0, 0, 0, type="double3")
             cmds.setAttr(f"{bind_joint}.jointOrient", 0, 0, 0, type="double3")
 
-        curve_obj_shape_list = cmds.listRelatives(slide_ctrl, shapes=True, type="nurbsCurve", fullPath=True)
-        if not curve_obj_shape_list:
-            print(f"No NURBS curve shape found under Slide_ctrl '{slide_ctrl}'. Skipping CV manipulation.")
-        else:
-            curve_obj_shape = curve_obj_shape_list[0]
-            cv_list = cmds.ls(f"{curve_obj_shape}.cv[*]", flatten=True)
-            
-            # Find curve center
-            try:
-                curve_transform = cmds.listRelatives(curve_obj_shape, parent=True, fullPath=True)[0]
-                curve_center = cmds.objectCenter(curve_transform, gl=True)
-            except:
-                # Manual calculation if objectCenter fails
-                bb = cmds.exactWorldBoundingBox(slide_ctrl)
-                curve_center = [(bb[0]+bb[3])/2, (bb[1]+bb[4])/2, (bb[2]+bb[5])/2]
-
-            # Scale down CVs
-            for cv in cv_list:
-                cv_pos = cmds.pointPosition(cv, world=True)
-                new_pos = [
-                    (cv_pos[0] - curve_center[0]) * 3 + curve_center[0],
-                    (cv_pos[1] - curve_center[1]) * 3 + curve_center[1],
-                    (cv_pos[2] - curve_center[2]) * 3 + curve_center[2]
-                ]
-                cmds.xform(cv, worldSpace=True, translation=new_pos)
-            
-            # Rotate CVs
-            cmds.rotate(90, 0, 0, f"{curve_obj_shape}.cv[*]", relative=True, objectSpace=True)
-            cmds.move(0, 0, 0.02, f"{curve_obj_shape}.cv[*]", relative=True, objectSpace=True, worldSpaceDistance=True)
-            print("Curve CV manipulation successfully applied.")
-
-        print(f"Advanced follicle setup applied for '{follicle_transform}'.")
+        log.debug("Advanced follicle setup applied for '%s'.", follicle_transform)
         return slide_ctrl, bind_joint
         
     except Exception as e:
         cmds.warning(f"Error creating advanced follicle connections: {e}")
         return None, None
 
-def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger"):
+def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger", mesh_sources=None):
     """
     Runs the main logic of Step 2: Get UV from locator position, create follicle
     and apply advanced follicle connections.
@@ -313,6 +264,7 @@ def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger"):
         mesh_shape_name (str): Name of the mesh shape node.
         locator_name (str): Name of the locator transform node.
         name_prefix (str, optional): Name prefix for objects to be created. Defaults to "textureRigger".
+        mesh_sources (tuple, optional): Precomputed get_mesh_connection_sources result for the mesh.
     
     Returns:
         tuple: (follicle_transform_name, slide_ctrl_name) or (None, None)
@@ -325,12 +277,13 @@ def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger"):
         return None, None
 
     # Get the world space position of the locator
-    locator_pos_list = cmds.xform(locator_name, query=True, translation=True, worldSpace=True)
-    if not locator_pos_list or len(locator_pos_list) != 3:
+    try:
+        selection_list = om.MSelectionList()
+        selection_list.add(locator_name)
+        locator_world_point = om.MFnTransform(selection_list.getDagPath(0)).translation(om.MSpace.kWorld)
+    except (RuntimeError, TypeError):
         cmds.warning(f"Could not get position of locator '{locator_name}'.")
         return None, None
-    
-    locator_world_point = om.MVector(locator_pos_list[0], locator_pos_list[1], locator_pos_list[2])
 
     # Find the corresponding UV on the mesh for this world position
     uv_coords = get_uv_at_point(mesh_shape_name, locator_world_point)
@@ -339,11 +292,11 @@ def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger"):
 
     if uv_coords:
         u, v = uv_coords
-        print(f"UV corresponding to locator position: ({u}, {v})")
+        log.debug("UV corresponding to locator position: (%s, %s)", u, v)
         
-        # 1. Create follicle and parent_grp
-        follicle_transform, initial_parent_group = create_follicle_at_uv(mesh_shape_name, u, v, name_prefix) # Pass original name_prefix for follicle creation
-        if follicle_transform and initial_parent_group:
+        # 1. Create follicle (parent_grp is only needed if the advanced setup below fails)
+        follicle_transform, _ = create_follicle_at_uv(mesh_shape_name, u, v, name_prefix, mesh_sources, skip_parent_grp=True) # Pass original name_prefix for follicle creation
+        if follicle_transform:
             follicle_shape_list = cmds.listRelatives(follicle_transform, shapes=True, type="follicle", fullPath=True)
             if not follicle_shape_list:
                 cmds.warning(f"Could not find follicle shape for follicle transform '{follicle_transform}'.")
@@ -357,20 +310,16 @@ def run_step2_logic(mesh_shape_name, locator_name, name_prefix="textureRigger"):
             slide_ctrl, bind_joint = setup_follicle_connections(follicle_transform, follicle_shape, actual_prefix) # Pass actual_prefix for internal nodes
             
             if slide_ctrl:
-                # Delete parent_grp if it's no longer used
-                if initial_parent_group and cmds.objExists(initial_parent_group):
-                    cmds.delete(initial_parent_group)
-                    print(f"Initial parent_grp '{initial_parent_group}' deleted.")
-                
                 # Select the slide control object
                 cmds.select(slide_ctrl, replace=True)
                 return follicle_transform, slide_ctrl
             else:
                 # If advanced setup fails, continue with basic follicle and parent_grp
+                initial_parent_group = create_follicle_parent_group(follicle_transform, name_prefix)
                 cmds.select(follicle_transform, replace=True)
                 return follicle_transform, initial_parent_group
         else:
-            cmds.warning("Could not create follicle and parent group.")
+            cmds.warning("Could not create follicle.")
             return None, None
     else:
         cmds.warning(f"Could not find UV coordinate on mesh '{mesh_shape_name}' for locator position.")
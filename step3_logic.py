@@ -1,5 +1,6 @@
 import maya.cmds as cmds
 import os
+import re
 
 def select_image_file():
     """
@@ -37,6 +38,8 @@ def select_alpha_image_file():
         return image_file[0]
     return None
 
+_LAYER_COLOR_PLUG_RE = re.compile(r'\.inputs\[(\d+)\]\.color$')
+
 def find_next_available_layer(layered_texture_node):
     """
     Finds the next available input layer on a layeredTexture node.
@@ -65,19 +68,14 @@ def get_max_layer_index(layered_texture_node):
     Returns:
         int: The highest used layer index, or -1 if no layers are used
     """
-    index = 0
+    # One query for every incoming connection instead of probing each index in turn
+    connections = cmds.listConnections(layered_texture_node, source=True, destination=False,
+                                       connections=True, plugs=True) or []
     max_found = -1
-    
-    # Check connections to find the highest used index
-    while True:
-        connections = cmds.listConnections(f"{layered_texture_node}.inputs[{index}].color", source=True, destination=False)
-        if connections:
-            max_found = index
-        
-        # We'll check a reasonable number of indices, but not infinitely
-        if index > 100:  # Arbitrary limit to avoid infinite loop
-            break
-        index += 1
+    for dest_plug in connections[::2]:
+        match = _LAYER_COLOR_PLUG_RE.search(dest_plug)
+        if match:
+            max_found = max(max_found, int(match.group(1)))
     
     return max_found
 
@@ -112,6 +110,23 @@ def shift_layers_down(layered_texture_node, max_index):
             cmds.connectAttr(alpha_connections[0], f"{layered_texture_node}.inputs[{i+1}].alpha", force=True)
             print(f"Moved alpha connection from input[{i}] to input[{i+1}]")
 
+def delete_existing_nodes(*nodes):
+    """
+    Deletes whichever of the given nodes still exist with a single delete call.
+    
+    Args:
+        *nodes (str): Node names; None or empty entries are ignored
+        
+    Returns:
+        int: Number of nodes deleted
+    """
+    names = [node for node in nodes if node]
+    # Never call ls with an empty list, it would return every node in the scene
+    existing = cmds.ls(names) if names else []
+    if existing:
+        cmds.delete(existing)
+    return len(existing)
+
 def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textureRigger", bind_joint=None):
     """
     Connects the specified texture to the mesh's material using a projection node.
@@ -199,7 +214,7 @@ def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textur
         
         if not material: # If not found via initialShadingGroup membership or other issues
             print(f"Creating a new Lambert material and assigning it to '{mesh_transform}'.")
-            mesh_base_name = mesh_transform.split('|')[-1].split(':')[-1] # Clean name for new nodes
+            mesh_base_name = mesh_transform.rpartition('|')[2].rpartition(':')[2] # Clean name for new nodes
             new_material_node = None
             new_sg_node = None
             try:
@@ -212,8 +227,7 @@ def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textur
                 print(f"Successfully created and assigned material '{material}' with SG '{new_sg_node}' to '{mesh_transform}'.")
             except RuntimeError as e:
                 print(f"Error creating/assigning new material for '{mesh_transform}': {e}")
-                if new_sg_node and cmds.objExists(new_sg_node): cmds.delete(new_sg_node)
-                if new_material_node and cmds.objExists(new_material_node): cmds.delete(new_material_node)
+                delete_existing_nodes(new_sg_node, new_material_node)
                 material = None
     
     # Ensure we have a material to work with
@@ -224,8 +238,8 @@ def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textur
     print(f"Using material '{material}' for texture connection")
     
     # Get material name for layered texture naming
-    material_name = material.split('|')[-1].split(':')[-1]
-    material_prefix = material_name.split('_')[0] if '_' in material_name else material_name
+    material_name = material.rpartition('|')[2].rpartition(':')[2]
+    material_prefix = material_name.partition('_')[0]
     layered_texture_name = f"{material_prefix}_layeredTexture"
     
     # Check if material already has a texture connected to its baseColor or color
@@ -250,7 +264,7 @@ def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textur
     
     # Check if what's connected is a layeredTexture (from previous runs of this tool)
     if material_color_connections:
-        connected_node = material_color_connections[0].split('.')[0]
+        connected_node = material_color_connections[0].partition('.')[0]
         if cmds.objectType(connected_node) == 'layeredTexture':
             layered_texture_node = connected_node
             existing_connection_to_layer = True
@@ -403,7 +417,8 @@ def connect_texture_to_mesh(mesh_transform, image_file_path, name_prefix="textur
         except Exception as e:
             cmds.warning(f"Failed to connect layered texture to material: {e}")
             # Clean up nodes if connection failed
-            cmds.delete(file_node, place2d_node, place3d_node, projection_node, layered_texture_node)
+            delete_existing_nodes(file_node, place2d_node, place3d_node, projection_node, layered_texture_node,
+                                  alpha_layered_texture_node, alpha_projection_node)
             return None, None, None, None, None, None
     
     # If bind_joint is provided, set up constraints
@@ -559,7 +574,7 @@ def find_bind_joint_from_follicle(follicle_transform):
         return None
     
     # Try to find the bind joint based on naming convention
-    base_name = follicle_transform.split('|')[-1].split(':')[-1]
+    base_name = follicle_transform.rpartition('|')[2].rpartition(':')[2]
     possible_bind_joint = f"{base_name}_bind"
     
     if cmds.objExists(possible_bind_joint):
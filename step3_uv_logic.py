@@ -192,7 +192,7 @@ def connect_texture_using_uvs(mesh_transform, image_file_path, name_prefix, foll
         
         if not material: # If not found via initialShadingGroup membership or other issues
             print(f"Creating a new Lambert material and assigning it to '{mesh_transform}'.")
-            mesh_base_name = mesh_transform.split('|')[-1].split(':')[-1] # Clean name for new nodes
+            mesh_base_name = mesh_transform.rpartition('|')[2].rpartition(':')[2] # Clean name for new nodes
             new_material_node = None
             new_sg_node = None
             try:
@@ -205,8 +205,7 @@ def connect_texture_using_uvs(mesh_transform, image_file_path, name_prefix, foll
                 print(f"Successfully created and assigned material '{material}' with SG '{new_sg_node}' to '{mesh_transform}'.")
             except RuntimeError as e:
                 print(f"Error creating/assigning new material for '{mesh_transform}': {e}")
-                if new_sg_node and cmds.objExists(new_sg_node): cmds.delete(new_sg_node)
-                if new_material_node and cmds.objExists(new_material_node): cmds.delete(new_material_node)
+                step3_logic.delete_existing_nodes(new_sg_node, new_material_node)
                 material = None
     
     # Ensure we have a material to work with
@@ -217,8 +216,8 @@ def connect_texture_using_uvs(mesh_transform, image_file_path, name_prefix, foll
     print(f"Using material '{material}' for texture connection")
     
     # Get material name for layered texture naming
-    material_name = material.split('|')[-1].split(':')[-1]
-    material_prefix = material_name.split('_')[0] if '_' in material_name else material_name
+    material_name = material.rpartition('|')[2].rpartition(':')[2]
+    material_prefix = material_name.partition('_')[0]
     layered_texture_name = f"{material_prefix}_layeredTexture"
     
     # Check if material already has a texture connected to its baseColor or color
@@ -243,7 +242,7 @@ def connect_texture_using_uvs(mesh_transform, image_file_path, name_prefix, foll
     
     # Check if what's connected is a layeredTexture (from previous runs of this tool)
     if material_color_connections:
-        connected_node = material_color_connections[0].split('.')[0]
+        connected_node = material_color_connections[0].partition('.')[0]
         if cmds.objectType(connected_node) == 'layeredTexture':
             layered_texture_node = connected_node
             existing_connection_to_layer = True
@@ -369,11 +368,8 @@ def connect_texture_using_uvs(mesh_transform, image_file_path, name_prefix, foll
         except Exception as e:
             cmds.warning(f"Failed to connect layered texture to material: {e}")
             # Clean up nodes if connection failed
-            cmds.delete(file_node, place2d_node)
-            if tex_ref_setup and 'uv_ref' in tex_ref_setup:
-                cmds.delete(tex_ref_setup['uv_ref'])
-            if cmds.objExists(layered_texture_node):
-                cmds.delete(layered_texture_node)
+            uv_ref = tex_ref_setup.get('uv_ref') if tex_ref_setup else None
+            step3_logic.delete_existing_nodes(file_node, place2d_node, uv_ref, layered_texture_node)
             return None, None, None, None, None, None
     
     # Place UV_Ref group under the Texture_ctrl_grp if it exists
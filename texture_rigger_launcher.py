@@ -0,0 +1,34 @@
+"""
+Launcher for the 2D Texture Rigger shelf button.
+The shelf command installed by install.py only adds this directory to sys.path and calls launch().
+Copyright 2025 by Hasan Çivili. All Rights Reserved. (Adapted for 2D Texture Rigger)
+"""
+import os
+import importlib
+import maya.cmds as cmds
+
+TOOL_MODULE_NAME = "TextureRiggerTool"
+
+def launch():
+    """Imports TextureRiggerTool and opens its UI, reporting any failure as a Maya warning."""
+    tool_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        # Dynamically import the module
+        module_to_run = importlib.import_module(TOOL_MODULE_NAME)
+        # Reload for development convenience (set TEXTURE_RIGGER_DEV to enable)
+        if os.environ.get('TEXTURE_RIGGER_DEV'):
+            importlib.reload(module_to_run)
+        # Call the UI function
+        module_to_run.show_ui()
+    except ImportError as e_import:
+        error_msg = f"2D Texture Rigger: IMPORT ERROR - {e_import}. Could not import '{TOOL_MODULE_NAME}'. Ensure it is in: {tool_dir}."
+        print(error_msg)
+        cmds.warning(error_msg)
+    except AttributeError as e_attr:
+        error_msg = f"2D Texture Rigger: ATTRIBUTE ERROR - {e_attr}. Could not find 'show_ui' in '{TOOL_MODULE_NAME}'."
+        print(error_msg)
+        cmds.warning(error_msg)
+    except Exception as e_runtime:
+        error_msg = f"2D Texture Rigger: RUNTIME ERROR - {e_runtime}."
+        print(error_msg)
+        cmds.warning(error_msg)